@@ -40,11 +40,19 @@
 '''
 # ==================================================================================================
 from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from PySide.QtGui import *
 from PySide.QtCore import *
 
-import FreeCAD
+from FreeCAD import Vector, Placement, Rotation
 import FreeCADGui
 import Part
 import Draft
@@ -62,14 +70,89 @@ __Wiki__ = "http://www.freecadweb.org/wiki/"
 __Icon__ = ""
 __IconW__ = ""
 __Help__ = ""
+
+# Color channel byte (0..255) to the 0..1 float used by the view providers.
+BYTE_TO_UNIT = tuple(i / 255.0 for i in range(256))
 # ==================================================================================================
 @dataclass
 class ObjectParameters:
     """Class to represent a design object's parameters."""
     object: "Part::Feature"
-    base: "FreeCAD.Vector"
-    center: "FreeCAD.Vector"
+    base: tuple[float, float, float]
+    center: tuple[float, float, float]
     boundingBoxEnabled: bool
+    axis: int = -1
+    centerAccessor: Optional[Callable] = None
+# ==================================================================================================
+# Center accessors by TypeId; any other object is centered on its shape's bounding box.
+
+def getShapeCenter(obj) -> Vector:
+    """Returns the center of the object's shape bounding box."""
+    return obj.Shape.BoundBox.Center
+
+
+CENTER_ACCESSORS = {
+    "Mesh::Feature": lambda obj: obj.Mesh.BoundBox.Center,
+    "Image::ImagePlane": lambda obj: obj.Placement.Base
+}
+
+
+def getCenterAccessor(obj):
+    """Returns the function giving the object's center."""
+    return CENTER_ACCESSORS.get(obj.TypeId, getShapeCenter)
+# ==================================================================================================
+# Snapping search: among the lines not along "axis", find the one closest to "center" along "axis"
+# within "snapDistance". Returns its index and the difference, or (-1, 0.0) if there is none.
+
+def findSnapLineLoop(coords, axes, axis, center, snapDistance):
+    """Scalar version of the snapping search, compiled with Numba when available."""
+    closest = -1
+    closestDiff = 0.0
+
+    for i in range(coords.shape[0]):
+        if axes[i] == axis:
+            continue
+
+        diff = coords[i, axis] - center
+
+        if abs(diff) <= snapDistance and (closest < 0 or abs(diff) < abs(closestDiff)):
+            closest = i
+            closestDiff = diff
+
+    return closest, closestDiff
+
+
+def findSnapLineNumPy(coords, axes, axis, center, snapDistance):
+    """Vectorized version of the snapping search, used when Numba is not available."""
+    candidates = np.flatnonzero(axes != axis)
+
+    if len(candidates) == 0:
+        return -1, 0.0
+
+    diffs = coords[candidates, axis] - center
+    closest = int(np.argmin(np.abs(diffs)))
+    diff = float(diffs[closest])
+
+    if abs(diff) > snapDistance:
+        return -1, 0.0
+
+    return int(candidates[closest]), diff
+
+
+def compileFindSnapLine():
+    """Returns the Numba compiled snapping search, or the NumPy version if it cannot be compiled."""
+    if njit is None:
+        return findSnapLineNumPy
+
+    try:
+        findSnapLine = njit(findSnapLineLoop)
+
+        # Compile now for the argument types used while dragging.
+        findSnapLine(np.zeros((1, 3), dtype=np.float64), np.zeros(1, dtype=np.int8), 0, 0.0, 0.0)
+    except Exception:
+        return findSnapLineNumPy
+
+    return findSnapLine
 # ==================================================================================================
 class MacroWindow(QMainWindow):
 
@@ -86,11 +169,18 @@ class MacroWindow(QMainWindow):
         self.LINE_CENTER_Y_LABEL_PREFIX = f"{self.LINE_CENTER_NAME_PREFIX}_cy"
         self.LINE_CENTER_Z_LABEL_PREFIX = f"{self.LINE_CENTER_NAME_PREFIX}_cz"
 
+        # Axis tags of the center lines, keyed on the label part following the name prefix.
+        self.LINE_CENTER_AXES = {"cx": 0, "cy": 1, "cz": 2}
+
         self.LINE_ORIGIN_NAME_SUFFIX = "origin"
         self.LINE_ORIGIN_X_NAME = f"{self.LINE_CENTER_X_LABEL_PREFIX}_{self.LINE_ORIGIN_NAME_SUFFIX}"
         self.LINE_ORIGIN_Y_NAME = f"{self.LINE_CENTER_Y_LABEL_PREFIX}_{self.LINE_ORIGIN_NAME_SUFFIX}"
         self.LINE_ORIGIN_Z_NAME = f"{self.LINE_CENTER_Z_LABEL_PREFIX}_{self.LINE_ORIGIN_NAME_SUFFIX}"
 
+        self.LINE_ORIGIN_NAMES = frozenset((self.LINE_ORIGIN_X_NAME,
+                                            self.LINE_ORIGIN_Y_NAME,
+                                            self.LINE_ORIGIN_Z_NAME))
+
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
@@ -104,15 +194,8 @@ class MacroWindow(QMainWindow):
 
         self.freeCADGuiMainWin = FreeCADGui.getMainWindow()
 
-        self.drawStyleActions = {
-            0: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleAsIs"),
-            1: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStylePoints"),
-            2: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleWireframe"),
-            3: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleHiddenLine"),
-            4: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleNoShading"),
-            5: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleShaded"),
-            6: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleFlatLines")
-        }
+        # Looked up on first use (see getDrawStyleAction).
+        self.drawStyleActions = {}
 
         self.drawStyleRevertAction = None
 
@@ -143,18 +226,39 @@ class MacroWindow(QMainWindow):
 
         self.ui.chkAlwaysOnTop.clicked.connect(self.chkAlwaysOnTopClicked)
 
+        # Slider ticks are buffered; see queueTranslation.
+        self.pendingTranslation = None
+
+        # Object and reference line names of the current snapping (None when not snapped).
+        self.snap = None
+
+        # Slider values of the last applied translation.
+        self.lastTranslation = None
+
+        self.translateTimer = QTimer(self)
+        self.translateTimer.setSingleShot(True)
+        self.translateTimer.timeout.connect(self.flushTranslation)
+
         self.transformActive = False
 
+        # Snapping search; compiled on the first drag with snapping rather than when the macro loads.
+        self.findSnapLine = findSnapLineNumPy
+        self.findSnapLineCompiled = False
+
+        # Groups resolved while a transformation is active (cleared when it ends).
+        self.groupCache = {}
+
         self.axisXTranslation = self.axisYTranslation = self.axisZTranslation = 0
 
         self.deltaTranslation = float(10 ** self.ui.sldTranslateDelta.value())
         self.snapDistance = float(10 ** self.ui.sldSnapDistance.value())
 
         # Synchronize the labels.
-        self.sldTranslateDeltaChanged()
         self.ui.sldSnapDistance.setValue(1)
+        self.updateTranslationLabels()
 
-        self.markerLineColor = (150 / 255.0, 150 / 255.0, 150 / 255.0, 0.0)
+        self.markerLineColor = (BYTE_TO_UNIT[150], BYTE_TO_UNIT[150], BYTE_TO_UNIT[150], 0.0)
+        self.markerQColor = QColor(150, 150, 150)
         self.markerLineWidth = 2
 
         self.snapLineColor = (0.0, 1.0, 1.0, 0.0)
@@ -162,10 +266,25 @@ class MacroWindow(QMainWindow):
 
         self.axesMarkerLineLength = 500
 
+        # Offsets of the center mark lines' end points from the center, along x, y and z.
+        self.axesMarkerOffsets = ((self.axesMarkerLineLength, 0, 0),
+                                  (0, self.axesMarkerLineLength, 0),
+                                  (0, 0, self.axesMarkerLineLength))
+
         self.chkAlwaysOnTopClicked()
 
         self.show()
 # ==================================================================================================
+    def changeEvent(self, event) -> None:
+
+        if event.type() == QEvent.LanguageChange:
+            Ui_MainWindow.translations = None
+            self.ui.retranslateUi(self)
+            self.updateTranslationLabels()
+
+        QMainWindow.changeEvent(self, event)
+# ==================================================================================================
+    @Slot()
     def chkAlwaysOnTopClicked(self) -> None:
 
         flags = self.windowFlags()
@@ -177,27 +296,57 @@ class MacroWindow(QMainWindow):
 
         self.show()
 # ==================================================================================================
-    def sldTranslateXChanged(self) -> None:
+    @Slot(int)
+    def sldTranslateXChanged(self, value) -> None:
 
-        self.translateSelection(self.ui.sldTranslateX.value(), 0, 0)
+        self.queueTranslation(value, 0, 0)
 # ==================================================================================================
-    def sldTranslateYChanged(self) -> None:
+    @Slot(int)
+    def sldTranslateYChanged(self, value) -> None:
 
-        self.translateSelection(0, self.ui.sldTranslateY.value(), 0)
+        self.queueTranslation(0, value, 0)
 # ==================================================================================================
-    def sldTranslateZChanged(self) -> None:
+    @Slot(int)
+    def sldTranslateZChanged(self, value) -> None:
 
-        self.translateSelection(0, 0, self.ui.sldTranslateZ.value())
+        self.queueTranslation(0, 0, value)
 # ==================================================================================================
-    def sldTranslateDeltaChanged(self) -> None:
+    def queueTranslation(self, x, y, z) -> None:
 
-        self.deltaTranslation = float(10 ** self.ui.sldTranslateDelta.value())
-        self.updateTranslationLabels()
+        # Only the latest slider position matters; intermediate ticks are dropped.
+        self.pendingTranslation = (x, y, z)
+
+        # While dragging, apply at most once per frame (~16 ms) so the selection keeps following
+        # the slider. Otherwise (keyboard or mouse wheel) restart the timer on every change so a
+        # burst of changes is applied once after it settles.
+        if self.transformActive:
+            if not self.translateTimer.isActive():
+                self.translateTimer.start(16)
+        else:
+            self.translateTimer.start(80)
 # ==================================================================================================
-    def sldSnapDistanceChanged(self) -> None:
+    @Slot()
+    def flushTranslation(self) -> None:
 
-        self.snapDistance = float(10 ** self.ui.sldSnapDistance.value())
-        self.updateTranslationLabels()
+        if self.pendingTranslation is None:
+            return
+
+        x, y, z = self.pendingTranslation
+        self.pendingTranslation = None
+
+        self.translateSelection(x, y, z)
+# ==================================================================================================
+    @Slot(int)
+    def sldTranslateDeltaChanged(self, value) -> None:
+
+        self.deltaTranslation = float(10 ** value)
+        self.ui.lblTranslateDelta.setText(f"{self.deltaTranslation:g}")
+# ==================================================================================================
+    @Slot(int)
+    def sldSnapDistanceChanged(self, value) -> None:
+
+        self.snapDistance = float(10 ** value)
+        self.ui.lblSnapDistance.setText(f"{self.snapDistance:g}")
 # ==================================================================================================
     def getSelectedObjects(self, extended=False) -> list[ObjectParameters]:
 
@@ -206,7 +355,11 @@ class MacroWindow(QMainWindow):
         else:
             objs2 = FreeCADGui.Selection.getSelection()
 
-        objs = []
+        selObjs = []
+
+        # Names of the objects already selected; an object must only be moved once even when it
+        # is selected both directly and through its group.
+        selectedNames = set()
 
         allowedTypeIds = ["Part", "Mesh", "Image"]
 
@@ -218,31 +371,70 @@ class MacroWindow(QMainWindow):
                 for subObj in obj.Group:
                     try:
                         if subObj.TypeId.split("::")[0] in allowedTypeIds:
-                            objs.append(subObj)
+                            if subObj.Name not in selectedNames:
+                                selectedNames.add(subObj.Name)
+                                selObjs.append(self.getObjectParameters(subObj))
                         else:
                             App.Console.PrintMessage(f"Not selecting \"{subObj.Label}\".\n")
                     except:
                         App.Console.PrintMessage(f"Exception; cannot select \"{subObj.Label}\".\n")
             else:
                 if obj.TypeId.split("::")[0] in allowedTypeIds:
-                    objs.append(obj)
+                    if obj.Name not in selectedNames:
+                        selectedNames.add(obj.Name)
+                        selObjs.append(self.getObjectParameters(obj))
                 else:
                     App.Console.PrintMessage(f"Not selecting \"{obj.Label}\".\n")
 
-        selObjs = [ObjectParameters(obj,
-                                    obj.Placement.Base,
-                                    self.getCenter(obj),
-                                    obj.ViewObject.BoundingBox)
-                   for obj in objs]
-
         return selObjs
 # ==================================================================================================
+    def getObjectParameters(self, obj, center=None, axis=-1) -> ObjectParameters:
+
+        base = obj.Placement.Base
+
+        if center is None:
+            center = self.getCenter(obj)
+
+        return ObjectParameters(obj,
+                                (base.x, base.y, base.z),
+                                (center.x, center.y, center.z),
+                                obj.ViewObject.BoundingBox,
+                                axis)
+# ==================================================================================================
+    @Slot()
     def sldPressed(self) -> None:
 
+        self.ui.statusBar.clearMessage()
+
         self.centerLines = []
 
+        # Drop a keyboard or mouse wheel change still waiting for its timer; otherwise it would be
+        # applied as a move on release.
+        self.translateTimer.stop()
+        self.pendingTranslation = None
+        self.resetTranslationSliders()
+
+        if self.ui.chkSnap.isChecked() and not self.findSnapLineCompiled:
+            self.findSnapLine = compileFindSnapLine()
+            self.findSnapLineCompiled = True
+
+        # Transformation has started.
+        self.transformActive = True
+
+        # Resolve the groups once; the per-tick lookups then never scan the document.
+        self.groupCache.clear()
+
+        for groupLabel in (self.GROUP_LABEL_CENTER_LINES,
+                           self.GROUP_LABEL_TEMP_CENTER_LINES,
+                           self.GROUP_LABEL_ORIGIN_LINES):
+            self.getGroup(groupLabel, False)
+
         self.selectedObjsParams = self.getSelectedObjects(extended=True)
-        self.selectedObjsParams += self.getSelectedObjects(extended=False)
+
+        self.selectionHasMeshes = any(p.object.TypeId.startswith("Mesh::") for p in self.selectedObjsParams)
+
+        self.selectedObjsBases = np.array([p.base for p in self.selectedObjsParams],
+                                          dtype=np.float64).reshape(-1, 3)
 
         if self.ui.chkBoundingBoxes.isChecked():
             for objParams in self.selectedObjsParams:
@@ -251,79 +443,105 @@ class MacroWindow(QMainWindow):
         self.centerLinesParams = self.getGroupObjects(self.GROUP_LABEL_CENTER_LINES)
         self.centerLinesParams += self.getGroupObjects(self.GROUP_LABEL_ORIGIN_LINES)
 
-        # Transformation has started.
-        self.transformActive = True
+        # The reference lines do not move while dragging; snapshot the ones usable for snapping
+        # as arrays of axes (0, 1, 2 for x, y, z) and start points.
+        self.snapLinesParams = []
+        snapLinesAxes = []
+
+        for centerLine in self.centerLinesParams:
+            if centerLine.axis < 0:
+                continue
+
+            self.snapLinesParams.append(centerLine)
+            snapLinesAxes.append(centerLine.axis)
+
+        self.snapLinesAxes = np.array(snapLinesAxes, dtype=np.int8)
+        self.snapLinesCoords = np.array([(float(p.object.X1), float(p.object.Y1), float(p.object.Z1))
+                                         for p in self.snapLinesParams], dtype=np.float64).reshape(-1, 3)
 
         if self.ui.chkWireFrame.isChecked():
             for i in range(7):
-                action = self.drawStyleActions[i]
+                action = self.getDrawStyleAction(i)
                 if action.isChecked():
                     self.drawStyleRevertAction = action
                     break
 
-            self.drawStyleActions[2].trigger()
+            self.getDrawStyleAction(2).trigger()
         else:
             self.drawStyleRevertAction = None
 
-        if self.ui.chkCenterMarks.isChecked():
+        # The marks are not moved with meshes (see translateSelection), so do not draw stale ones.
+        if self.ui.chkCenterMarks.isChecked() and not self.selectionHasMeshes:
             self.drawCenterMarks(0, 0, 0, True)
+# ==================================================================================================
+    def getDrawStyleAction(self, i) -> QAction:
+
+        # Searching the main window's children is slow; resolve all the actions on first use.
+        if not self.drawStyleActions:
+            self.drawStyleActions = {
+                0: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleAsIs"),
+                1: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStylePoints"),
+                2: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleWireframe"),
+                3: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleHiddenLine"),
+                4: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleNoShading"),
+                5: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleShaded"),
+                6: self.freeCADGuiMainWin.findChild(QAction, "Std_DrawStyleFlatLines")
+            }
+
+        return self.drawStyleActions[i]
 # ==================================================================================================
     def drawCenterMarks(self, dx, dy, dz, add) -> None:
 
-        for i, objParams in enumerate(self.selectedObjsParams):
-            lines = self.drawCenterMark(i, self.getCenter(objParams.object), (dx, dy, dz), "", add)
-            if add:
+        # Marks are added at the centers captured when the slider was pressed; (dx, dy, dz) is
+        # the translation from those centers when moving them.
+        if add:
+            for objParams in self.selectedObjsParams:
+                lines = self.createCenterMark(objParams.center, "")
                 self.centerLines.append(lines)
                 self.addToGroup(lines, self.GROUP_LABEL_TEMP_CENTER_LINES)
-# ==================================================================================================
-    # Draw and move center marks.
+        else:
+            # All the marks move by the same translation; build its placement once.
+            placement = Placement(Vector(dx, dy, dz), Rotation())
 
-    def drawCenterMark(self, i, p1, offset, objectLabel, add) -> list:
+            for i in range(len(self.centerLines)):
+                self.updateCenterMark(i, placement)
+# ==================================================================================================
+    def updateCenterMark(self, i, placement) -> None:
 
-        dx = offset[0]
-        dy = offset[1]
-        dz = offset[2]
+        # The lines were added around the center without an offset; move them with one placement
+        # write per line instead of writing the six end point coordinates.
+        for line in self.centerLines[i]:
+            line.Placement = placement
+# ==================================================================================================
+    def createCenterMark(self, p1, objectLabel) -> list:
 
-        p2 = FreeCAD.Vector(self.axesMarkerLineLength, 0, 0)
-        p3 = FreeCAD.Vector(0, self.axesMarkerLineLength, 0)
-        p4 = FreeCAD.Vector(0, 0, self.axesMarkerLineLength)
+        cx = p1[0]
+        cy = p1[1]
+        cz = p1[2]
 
         lines = []
 
-        start1 = (p1 - p2) + FreeCAD.Vector(dx, dy, dz)
-        end1 = (p1 + p2) + FreeCAD.Vector(dx, dy, dz)
-
-        start2 = (p1 - p3) + FreeCAD.Vector(dx, dy, dz)
-        end2 = (p1 + p3) + FreeCAD.Vector(dx, dy, dz)
+        linesSpecs = zip((self.LINE_CENTER_X_LABEL_PREFIX,
+                          self.LINE_CENTER_Y_LABEL_PREFIX,
+                          self.LINE_CENTER_Z_LABEL_PREFIX),
+                         self.axesMarkerOffsets)
 
-        start3 = (p1 - p4) + FreeCAD.Vector(dx, dy, dz)
-        end3 = (p1 + p4) + FreeCAD.Vector(dx, dy, dz)
+        for labelPrefix, (ox, oy, oz) in linesSpecs:
+            line = App.ActiveDocument.addObject("Part::Line", self.LINE_CENTER_NAME_PREFIX)
+            line.ViewObject.LineColor = self.markerLineColor
+            line.ViewObject.LineWidth = self.markerLineWidth
 
-        linesSpecs = [
-            (0, self.LINE_CENTER_X_LABEL_PREFIX, start1, end1),
-            (1, self.LINE_CENTER_Y_LABEL_PREFIX, start2, end2),
-            (2, self.LINE_CENTER_Z_LABEL_PREFIX, start3, end3)
-        ]
-
-        for index, labelPrefix, start, end in linesSpecs:
-            if add:
-                line = App.ActiveDocument.addObject("Part::Line", self.LINE_CENTER_NAME_PREFIX)
-                line.ViewObject.LineColor = self.markerLineColor
-                line.ViewObject.LineWidth = self.markerLineWidth
-
-                if objectLabel != "":
-                    line.Label = f"{labelPrefix}_{objectLabel}"
-                else:
-                    line.Label = f"{labelPrefix}"
+            if objectLabel != "":
+                line.Label = f"{labelPrefix}_{objectLabel}"
             else:
-                line = self.centerLines[i][index]
+                line.Label = f"{labelPrefix}"
 
-            line.X1 = start.x
-            line.Y1 = start.y
-            line.Z1 = start.z
-            line.X2 = end.x
-            line.Y2 = end.y
-            line.Z2 = end.z
+            line.X1 = cx - ox
+            line.Y1 = cy - oy
+            line.Z1 = cz - oz
+            line.X2 = cx + ox
+            line.Y2 = cy + oy
+            line.Z2 = cz + oz
 
             lines.append(line)
 
@@ -373,7 +591,10 @@ class MacroWindow(QMainWindow):
 # ==================================================================================================
     def getGroup(self, groupLabel, autoCreate):
 
-        group = None
+        group = self.groupCache.get(groupLabel)
+
+        if group is not None:
+            return group
 
         selection = App.ActiveDocument.getObjectsByLabel(groupLabel)
 
@@ -386,16 +607,24 @@ class MacroWindow(QMainWindow):
             if autoCreate:
                 group = App.ActiveDocument.addObject("App::DocumentObjectGroup", groupLabel)
 
+        if group is not None and self.transformActive:
+            self.groupCache[groupLabel] = group
+
         return group
 # ==================================================================================================
     def removeGroup(self, groupLabel) -> None:
 
+        # The group is cached while transforming, so it is removed by reference without a label lookup.
+        group = self.getGroup(groupLabel, False)
+
+        if group is None:
+            return
+
         objsParams = self.getGroupObjects(groupLabel)
 
-        for objParams in objsParams:
-            self.removeObject(objParams.object)
+        self.removeObjects([objParams.object for objParams in objsParams] + [group])
 
-        self.removeObjectsByLabel(groupLabel)
+        self.groupCache.pop(groupLabel, None)
 # ==================================================================================================
     def addToGroup(self, objs, groupLabel) -> None:
 
@@ -411,22 +640,32 @@ class MacroWindow(QMainWindow):
         if group == None:
             return []
 
-        objs = []
+        groupObjs = []
 
         for obj in group.Group:
-            if type(obj.Shape) != Part.Face:
-                objs.append(obj)
+            # The shape is fetched once for both the type check and the center.
+            shape = obj.Shape
+
+            if not isinstance(shape, Part.Face):
+                groupObjs.append(self.getObjectParameters(obj,
+                                                          shape.BoundBox.Center,
+                                                          self.getLineAxis(obj.Label)))
             else:
                 App.Console.PrintMessage(f"Not selecting \"{obj.Label}\".\n")
 
-        groupObjs = [ObjectParameters(obj,
-                                      obj.Placement.Base,
-                                      self.getCenter(obj),
-                                      obj.ViewObject.BoundingBox)
-                     for obj in objs]
-
         return groupObjs
 # ==================================================================================================
+    def getLineAxis(self, label) -> int:
+
+        # Center line labels are "<LINE_CENTER_NAME_PREFIX>_c<axis>..."; -1 for any other label.
+        if not label.startswith(self.LINE_CENTER_NAME_PREFIX):
+            return -1
+
+        start = len(self.LINE_CENTER_NAME_PREFIX) + 1
+
+        return self.LINE_CENTER_AXES.get(label[start:start + 2], -1)
+# ==================================================================================================
+    @Slot()
     def btnAddCenterMarkClicked(self) -> None:
 
         self.ui.statusBar.clearMessage()
@@ -437,17 +676,23 @@ class MacroWindow(QMainWindow):
             self.ui.statusBar.showMessage("Nothing selected.")
             return
 
+        # Add all the center marks as a single undoable step.
+        App.ActiveDocument.openTransaction("Add center marks")
+
         for objParams in self.selectedObjsParams:
             obj = objParams.object
 
-            l1, l2, l3 = self.drawCenterMark(0, self.getCenter(obj), (0, 0, 0), obj.Label, True)
+            l1, l2, l3 = self.createCenterMark(objParams.center, obj.Label)
 
             l1.ViewObject.LineColor = self.markerLineColor
             l2.ViewObject.LineColor = self.markerLineColor
             l3.ViewObject.LineColor = self.markerLineColor
 
             self.addToGroup((l1, l2, l3), self.GROUP_LABEL_CENTER_LINES)
+
+        App.ActiveDocument.commitTransaction()
 # ==================================================================================================
+    @Slot()
     def btnToggleOriginMarkClicked(self) -> None:
 
         group = self.getGroup(self.GROUP_LABEL_ORIGIN_LINES, False)
@@ -457,16 +702,23 @@ class MacroWindow(QMainWindow):
         else:
             self.addRemoveOriginMark(False)
 # ==================================================================================================
+    @Slot()
     def sldReleased(self) -> None:
 
+        # Apply the last buffered slider position before the transformation ends.
+        if self.translateTimer.isActive():
+            self.translateTimer.stop()
+            self.flushTranslation()
+
         prevTransform = self.transformActive
 
         # Transformation has ended.
         self.transformActive = False
 
-        self.ui.sldTranslateX.setValue(0)
-        self.ui.sldTranslateY.setValue(0)
-        self.ui.sldTranslateZ.setValue(0)
+        self.resetTranslationSliders()
+
+        self.axisXTranslation = self.axisYTranslation = self.axisZTranslation = 0
+        self.lastTranslation = None
 
         self.updateTranslationLabels()
 
@@ -478,24 +730,36 @@ class MacroWindow(QMainWindow):
             for objParams in self.selectedObjsParams:
                 objParams.object.ViewObject.BoundingBox = objParams.boundingBoxEnabled
 
+        # Update the views once the objects are in place instead of on every tick.
+        if self.ui.chkAutoUpdateView.isChecked():
+            for objParams in self.selectedObjsParams:
+                objParams.object.ViewObject.update()
+
         if self.drawStyleRevertAction is not None:
             self.drawStyleRevertAction.trigger()
 
         self.removeGroup(self.GROUP_LABEL_TEMP_CENTER_LINES)
 
         # Clear snapping related highlighting.
-        self.formatOriginMark()
+        self.clearSnapHighlighting()
+        self.snap = None
 
-        # Clear snapping related highlighting.
-        for centerLine in self.centerLinesParams:
-            lineCL = centerLine.object
-            if not self.isOriginLine(lineCL.Label):
-                lineCL.ViewObject.LineColor = self.markerLineColor
-                lineCL.ViewObject.LineWidth = self.markerLineWidth
+        self.groupCache.clear()
 
         if self.ui.chkAutoRecompute.isChecked():
             App.ActiveDocument.recompute()
 # ==================================================================================================
+    def resetTranslationSliders(self) -> None:
+
+        # Resetting the sliders must not re-enter the translation.
+        with QSignalBlocker(self.ui.sldTranslateX), \
+                QSignalBlocker(self.ui.sldTranslateY), \
+                QSignalBlocker(self.ui.sldTranslateZ):
+            self.ui.sldTranslateX.setValue(0)
+            self.ui.sldTranslateY.setValue(0)
+            self.ui.sldTranslateZ.setValue(0)
+# ==================================================================================================
+    @Slot()
     def btnResetTransformsClicked(self) -> None:
 
         self.ui.statusBar.clearMessage()
@@ -509,126 +773,120 @@ class MacroWindow(QMainWindow):
 # ==================================================================================================
     def updateTranslationLabels(self) -> None:
 
+        self.updateAxisTranslationLabels()
+
+        self.ui.lblTranslateDelta.setText(f"{self.deltaTranslation:g}")
+        self.ui.lblSnapDistance.setText(f"{self.snapDistance:g}")
+# ==================================================================================================
+    def updateAxisTranslationLabels(self) -> None:
+
         self.ui.lblTranslateX.setText(f"{self.axisXTranslation:g}")
         self.ui.lblTranslateY.setText(f"{self.axisYTranslation:g}")
         self.ui.lblTranslateZ.setText(f"{self.axisZTranslation:g}")
-        self.ui.lblTranslateDelta.setText(f"{self.deltaTranslation:g}")
-        self.ui.lblSnapDistance.setText(f"{self.snapDistance:g}")
 # ==================================================================================================
     def translateSelection(self, x, y, z) -> None:
 
-        self.ui.statusBar.clearMessage()
-
         if len(self.selectedObjsParams) == 0:
             self.ui.statusBar.showMessage("Nothing selected.")
             return
 
         if not self.transformActive:
-            self.ui.sldTranslateX.setValue(0)
-            self.ui.sldTranslateY.setValue(0)
-            self.ui.sldTranslateZ.setValue(0)
+            self.ui.statusBar.clearMessage()
+
+            self.resetTranslationSliders()
 
             self.axisXTranslation = self.axisYTranslation = self.axisZTranslation = 0
             self.updateTranslationLabels()
             return
 
-        for i in range(len(self.selectedObjsParams)):
-            obj = self.selectedObjsParams[i].object
-
-            # Use the base as a reference before moving started (updated when the slider is released).
-            base = self.selectedObjsParams[i].base
-
-            self.axisXTranslation = x * self.deltaTranslation
-            self.axisYTranslation = y * self.deltaTranslation
-            self.axisZTranslation = z * self.deltaTranslation
+        # Nothing to do when the slider repeats the same value.
+        if self.lastTranslation == (x, y, z):
+            return
 
-            if self.ui.chkSnap.isChecked():
-                self.checkSnapping()
+        self.lastTranslation = (x, y, z)
 
-            newX = base.x + self.axisXTranslation
-            newY = base.y + self.axisYTranslation
-            newZ = base.z + self.axisZTranslation
+        self.axisXTranslation = x * self.deltaTranslation
+        self.axisYTranslation = y * self.deltaTranslation
+        self.axisZTranslation = z * self.deltaTranslation
 
-            newBase = FreeCAD.Vector(newX, newY, newZ)
+        if self.ui.chkSnap.isChecked():
+            self.checkSnapping()
 
-            obj.Placement.Base = newBase
+        # Use the bases as a reference before moving started (updated when the slider is released).
+        translation = (self.axisXTranslation, self.axisYTranslation, self.axisZTranslation)
+        newBases = (self.selectedObjsBases + translation).tolist()
 
-            if self.ui.chkAutoUpdateView.isChecked():
-                obj.ViewObject.update()
+        for objParams, newBase in zip(self.selectedObjsParams, newBases):
+            objParams.object.Placement.Base = Vector(*newBase)
 
-            if self.ui.chkCenterMarks.isChecked():
-                self.drawCenterMarks(0, 0, 0, False)
+        # Moving center marks along with meshes makes dragging them stall; the marks are skipped.
+        if self.ui.chkCenterMarks.isChecked() and not self.selectionHasMeshes:
+            self.drawCenterMarks(self.axisXTranslation, self.axisYTranslation, self.axisZTranslation, False)
 
-            self.updateTranslationLabels()
+        # The step and snapping distance cannot change while dragging; refresh them on release.
+        self.updateAxisTranslationLabels()
 # ==================================================================================================
     def checkSnapping(self) -> None:
 
-        self.axisXTranslation2 = self.axisXTranslation
-        self.axisYTranslation2 = self.axisYTranslation
-        self.axisZTranslation2 = self.axisZTranslation
-
-        for objParams in self.selectedObjsParams:
-            # Use the center as a reference before moving starts (updated when the slider is released).
-            center = objParams.center
+        translations = [self.axisXTranslation, self.axisYTranslation, self.axisZTranslation]
 
-            newCenterX = center[0] + self.axisXTranslation
-            newCenterY = center[1] + self.axisYTranslation
-            newCenterZ = center[2] + self.axisZTranslation
+        # Only one slider moves at a time; its axis indexes the translations and the coordinates.
+        axis = next((i for i, translation in enumerate(translations) if abs(translation) > 0), -1)
 
-            snapped = False
+        objCL = lineCL = None
 
-            # Clear snapping related highlighting.
-            self.formatOriginMark()
+        # Without a translation there is nothing to snap to.
+        if axis >= 0:
+            for objParams in self.selectedObjsParams:
+                # Use the center as a reference before moving starts (updated when the slider is released).
+                newCenter = objParams.center[axis] + translations[axis]
 
-            for centerLine in self.centerLinesParams:
-                lineCL = centerLine.object
-                labelCL = lineCL.Label
-
-                # Clear snapping related highlighting.
-                if not self.isOriginLine(labelCL):
-                    lineCL.ViewObject.LineColor = self.markerLineColor
-                    lineCL.ViewObject.LineWidth = self.markerLineWidth
-
-                if abs(self.axisXTranslation) > 0:
-                    if labelCL.startswith(self.LINE_CENTER_Y_LABEL_PREFIX) or \
-                            labelCL.startswith(self.LINE_CENTER_Z_LABEL_PREFIX):
-                        xdiff = float(lineCL.X1) - newCenterX
-                        if abs(xdiff) <= self.snapDistance:
-                            self.axisXTranslation2 += xdiff
-                            snapped = True
-
-                elif abs(self.axisYTranslation) > 0:
-                    if labelCL.startswith(self.LINE_CENTER_X_LABEL_PREFIX) or \
-                            labelCL.startswith(self.LINE_CENTER_Z_LABEL_PREFIX):
-                        ydiff = float(lineCL.Y1) - newCenterY
-                        if abs(ydiff) <= self.snapDistance:
-                            self.axisYTranslation2 += ydiff
-                            snapped = True
-
-                elif abs(self.axisZTranslation) > 0:
-                    if labelCL.startswith(self.LINE_CENTER_X_LABEL_PREFIX) or \
-                            labelCL.startswith(self.LINE_CENTER_Y_LABEL_PREFIX):
-                        zdiff = float(lineCL.Z1) - newCenterZ
-                        if abs(zdiff) <= self.snapDistance:
-                            self.axisZTranslation2 += zdiff
-                            snapped = True
-
-                if snapped:
-                    break
+                # Snap to the closest line within the snapping distance.
+                closest, diff = self.findSnapLine(self.snapLinesCoords, self.snapLinesAxes, axis, newCenter,
+                                                  self.snapDistance)
 
-            if snapped:
-                message = f"\"{objParams.object.Label}\" snapped to reference line \"{labelCL}\"."
-                self.ui.statusBar.showMessage(message)
+                if closest < 0:
+                    continue
 
-                lineCL.ViewObject.LineColor = self.snapLineColor
-                lineCL.ViewObject.LineWidth = self.snapLineWidth
+                objCL = objParams.object
+                lineCL = self.snapLinesParams[closest].object
 
-                self.axisXTranslation = self.axisXTranslation2
-                self.axisYTranslation = self.axisYTranslation2
-                self.axisZTranslation = self.axisZTranslation2
+                translations[axis] += float(diff)
+                self.axisXTranslation, self.axisYTranslation, self.axisZTranslation = translations
 
                 break
+
+        # The highlighting and the status bar only change when the snapping does.
+        snap = None if lineCL is None else (objCL.Name, lineCL.Name)
+
+        if snap == self.snap:
+            return
+
+        self.snap = snap
+
+        self.clearSnapHighlighting()
+
+        if lineCL is None:
+            self.ui.statusBar.clearMessage()
+            return
+
+        message = f"\"{objCL.Label}\" snapped to reference line \"{lineCL.Label}\"."
+        self.ui.statusBar.showMessage(message)
+
+        lineCL.ViewObject.LineColor = self.snapLineColor
+        lineCL.ViewObject.LineWidth = self.snapLineWidth
+# ==================================================================================================
+    def clearSnapHighlighting(self) -> None:
+
+        self.formatOriginMark()
+
+        for centerLine in self.centerLinesParams:
+            lineCL = centerLine.object
+            if not self.isOriginLine(lineCL.Label):
+                lineCL.ViewObject.LineColor = self.markerLineColor
+                lineCL.ViewObject.LineWidth = self.markerLineWidth
 # ==================================================================================================
+    @Slot()
     def btnAddDimensionClicked(self) -> None:
 
         self.ui.statusBar.clearMessage()
@@ -656,17 +914,8 @@ class MacroWindow(QMainWindow):
             self.ui.statusBar.showMessage("Please select two parts; edge or vertex.")
             return
 
-        p1 = p2 = None
-
-        if type(obj1) == Part.Vertex:
-            p1 = FreeCAD.Vector(obj1.X, obj1.Y, obj1.Z)
-        elif type(obj1) == Part.Edge:
-            p1 = obj1.firstVertex().Point
-
-        if type(obj2) == Part.Vertex:
-            p2 = FreeCAD.Vector(obj2.X, obj2.Y, obj2.Z)
-        elif type(obj2) == Part.Edge:
-            p2 = obj2.firstVertex().Point
+        p1 = self.getDimensionPoint(obj1)
+        p2 = self.getDimensionPoint(obj2)
 
         if p1 == None or p2 == None:
             self.ui.statusBar.showMessage("Please select two parts; edge or vertex.")
@@ -675,11 +924,11 @@ class MacroWindow(QMainWindow):
         dimensionType = str(self.sender().objectName())[-1:]
 
         if dimensionType == "X":
-            p2 = FreeCAD.Vector(p2.x, p1.y, p1.z)
+            p2 = Vector(p2.x, p1.y, p1.z)
         elif dimensionType == "Y":
-            p2 = FreeCAD.Vector(p1.x, p2.y, p1.z)
+            p2 = Vector(p1.x, p2.y, p1.z)
         elif dimensionType == "Z":
-            p2 = FreeCAD.Vector(p1.x, p1.y, p2.z)
+            p2 = Vector(p1.x, p1.y, p2.z)
         else:
             return
 
@@ -694,77 +943,118 @@ class MacroWindow(QMainWindow):
         dv.ArrowType = 0
         dv.LineColor = self.markerLineColor
 # ==================================================================================================
+    def getDimensionPoint(self, subObj) -> Vector:
+
+        if isinstance(subObj, Part.Vertex):
+            return subObj.Point
+
+        if isinstance(subObj, Part.Edge):
+            return subObj.firstVertex().Point
+
+        return None
+# ==================================================================================================
+    @Slot()
     def btnOrthographicClicked(self) -> None:
 
         self.ui.statusBar.clearMessage()
 
         Gui.activeDocument().activeView().setCameraType("Orthographic")
 # ==================================================================================================
+    @Slot()
     def btnPerspectiveClicked(self) -> None:
 
         self.ui.statusBar.clearMessage()
 
         Gui.activeDocument().activeView().setCameraType("Perspective")
 # ==================================================================================================
+    @Slot()
     def btnDefaultLineColorClicked(self) -> None:
 
         self.ui.statusBar.clearMessage()
 
-        r = self.markerLineColor[0] * 255
-        g = self.markerLineColor[1] * 255
-        b = self.markerLineColor[2] * 255
-
-        color = QColorDialog.getColor(QColor(r, g, b), None)
-
-        r = color.red()
-        g = color.green()
-        b = color.blue()
+        color = QColorDialog.getColor(self.markerQColor, None)
 
-        # "r", "g" and "b" are zero when the dialog is canceled.
-        if not (r == g == b == 0):
-            self.markerLineColor = (r / 255.0, g / 255.0, b / 255.0, 0.0)
-# ==================================================================================================
-    def removeObject(self, obj) -> None:
+        # The color is invalid when the dialog is canceled.
+        if not color.isValid() or color == self.markerQColor:
+            return
 
-        App.ActiveDocument.removeObject(obj.Name)
+        self.markerQColor = color
+        self.markerLineColor = (BYTE_TO_UNIT[color.red()], BYTE_TO_UNIT[color.green()],
+                                BYTE_TO_UNIT[color.blue()], 0.0)
 # ==================================================================================================
     def removeObjects(self, objs) -> None:
 
-        for obj in objs:
-            self.removeObject(obj)
-# ==================================================================================================
-    def removeObjectsByLabel(self, label) -> None:
-
-        objs = App.ActiveDocument.getObjectsByLabel(label)
+        doc = App.ActiveDocument
 
         for obj in objs:
-            self.removeObject(obj)
+            doc.removeObject(obj.Name)
 # ==================================================================================================
     def isOriginLine(self, label):
 
-        return label in [self.LINE_ORIGIN_X_NAME, self.LINE_ORIGIN_Y_NAME, self.LINE_ORIGIN_Z_NAME]
+        return label in self.LINE_ORIGIN_NAMES
 # ==================================================================================================
-    def getCenter(self, obj) -> "FreeCAD.Vector":
-
-        if obj.TypeId == "Mesh::Feature":
-            center = obj.Mesh.BoundBox.Center
-        elif obj.TypeId == "Image::ImagePlane":
-            center = obj.Placement.Base
-        else:
-            center = obj.Shape.BoundBox.Center
+    def getCenter(self, obj) -> Vector:
 
-        return center
+        return getCenterAccessor(obj)(obj)
 # ===========================================================================
-    def getAllCenters(self) -> list["FreeCAD.Vector"]:
+    def getAllCenters(self) -> np.ndarray:
 
-        centers = []
+        # One row (x, y, z) per selected object.
+        centers = np.empty((len(self.selectedObjsParams), 3), dtype=np.float64)
 
-        for objParams in self.selectedObjsParams:
-            centers.append(self.getCenter(objParams.object))
+        for i, objParams in enumerate(self.selectedObjsParams):
+            # The accessor is resolved from the TypeId once per selected object.
+            if objParams.centerAccessor is None:
+                objParams.centerAccessor = getCenterAccessor(objParams.object)
+
+            center = objParams.centerAccessor(objParams.object)
+            centers[i] = (center.x, center.y, center.z)
 
         return centers
 # ===========================================================================
 class Ui_MainWindow(object):
+    translations = None
+
+    # Slider ranges: -50..50 for the translations, -9..9 for the step and snapping exponents.
+    SLIDER_50 = {"minimum": -50, "maximum": 50, "pageStep": 1, "orientation": Qt.Horizontal}
+    SLIDER_9 = {"minimum": -9, "maximum": 9, "pageStep": 1, "orientation": Qt.Horizontal}
+
+    # Widgets of the "Transform" tab: (class, object name, geometry, properties set by name).
+    # The geometry rects are built once here and shared by every window instance.
+    WIDGETS = [
+        (QPushButton, "btnResetTransforms", QRect(310, 160, 140, 40), {"enabled": True}),
+        (QSlider, "sldTranslateX", QRect(50, 0, 300, 40), SLIDER_50),
+        (QSlider, "sldTranslateY", QRect(50, 30, 300, 40), SLIDER_50),
+        (QSlider, "sldTranslateZ", QRect(50, 60, 300, 40), SLIDER_50),
+        (QSlider, "sldTranslateDelta", QRect(50, 90, 300, 40), SLIDER_9),
+        (QCheckBox, "chkWireFrame", QRect(10, 340, 180, 30), {}),
+        (QLabel, "lbldX", QRect(10, 10, 40, 20), {}),
+        (QLabel, "lbldY", QRect(10, 40, 40, 20), {}),
+        (QLabel, "lbldZ", QRect(10, 70, 40, 20), {}),
+        (QLabel, "lblStep", QRect(10, 100, 40, 20), {}),
+        (QLabel, "lblTranslateX", QRect(360, 10, 100, 20), {"alignment": Qt.AlignCenter}),
+        (QLabel, "lblTranslateZ", QRect(360, 70, 100, 20), {"alignment": Qt.AlignCenter}),
+        (QLabel, "lblTranslateY", QRect(360, 40, 100, 20), {"alignment": Qt.AlignCenter}),
+        (QLabel, "lblTranslateDelta", QRect(360, 100, 100, 20), {"alignment": Qt.AlignCenter}),
+        (QPushButton, "btnAddDimensionZ", QRect(310, 260, 140, 40), {"enabled": True}),
+        (QPushButton, "btnOrthographic", QRect(10, 160, 140, 40), {"enabled": True}),
+        (QPushButton, "btnPerspective", QRect(10, 210, 140, 40), {"enabled": True}),
+        (QPushButton, "btnAddCenterMark", QRect(160, 160, 140, 40), {"enabled": True}),
+        (QCheckBox, "chkSnap", QRect(10, 370, 180, 30), {"checked": True}),
+        (QPushButton, "btnDefaultLineColor", QRect(310, 210, 140, 40), {"enabled": True}),
+        (QCheckBox, "chkCenterMarks", QRect(160, 340, 180, 30), {"checked": True}),
+        (QCheckBox, "chkAutoUpdateView", QRect(10, 400, 180, 30), {}),
+        (QCheckBox, "chkAutoRecompute", QRect(160, 370, 180, 30), {"checked": True}),
+        (QSlider, "sldSnapDistance", QRect(50, 120, 300, 40), SLIDER_9),
+        (QLabel, "lblSnapDistance", QRect(360, 130, 100, 20), {"alignment": Qt.AlignCenter}),
+        (QLabel, "lblSnap", QRect(10, 130, 40, 20), {}),
+        (QCheckBox, "chkBoundingBoxes", QRect(160, 310, 180, 30), {"checked": True}),
+        (QCheckBox, "chkAlwaysOnTop", QRect(10, 310, 180, 30), {}),
+        (QPushButton, "btnAddDimensionY", QRect(160, 260, 140, 40), {"enabled": True}),
+        (QPushButton, "btnAddDimensionX", QRect(10, 260, 140, 40), {"enabled": True}),
+        (QPushButton, "btnToggleOriginMark", QRect(160, 210, 140, 40), {"enabled": True})
+    ]
+
     def setupUi(self, MainWindow):
         if not MainWindow.objectName():
             MainWindow.setObjectName(u"MainWindow")
@@ -793,155 +1083,8 @@ class Ui_MainWindow(object):
         self.tabMain.setDocumentMode(True)
         self.tab = QWidget()
         self.tab.setObjectName(u"tab")
-        self.btnResetTransforms = QPushButton(self.tab)
-        self.btnResetTransforms.setObjectName(u"btnResetTransforms")
-        self.btnResetTransforms.setEnabled(True)
-        self.btnResetTransforms.setGeometry(QRect(310, 160, 140, 40))
-        self.btnResetTransforms.setMinimumSize(QSize(0, 0))
-        self.btnResetTransforms.setStyleSheet(u"")
-        self.sldTranslateX = QSlider(self.tab)
-        self.sldTranslateX.setObjectName(u"sldTranslateX")
-        self.sldTranslateX.setGeometry(QRect(50, 0, 300, 40))
-        self.sldTranslateX.setMinimum(-50)
-        self.sldTranslateX.setMaximum(50)
-        self.sldTranslateX.setPageStep(1)
-        self.sldTranslateX.setOrientation(Qt.Horizontal)
-        self.sldTranslateY = QSlider(self.tab)
-        self.sldTranslateY.setObjectName(u"sldTranslateY")
-        self.sldTranslateY.setGeometry(QRect(50, 30, 300, 40))
-        self.sldTranslateY.setMinimum(-50)
-        self.sldTranslateY.setMaximum(50)
-        self.sldTranslateY.setPageStep(1)
-        self.sldTranslateY.setOrientation(Qt.Horizontal)
-        self.sldTranslateZ = QSlider(self.tab)
-        self.sldTranslateZ.setObjectName(u"sldTranslateZ")
-        self.sldTranslateZ.setGeometry(QRect(50, 60, 300, 40))
-        self.sldTranslateZ.setMinimum(-50)
-        self.sldTranslateZ.setMaximum(50)
-        self.sldTranslateZ.setPageStep(1)
-        self.sldTranslateZ.setOrientation(Qt.Horizontal)
-        self.sldTranslateDelta = QSlider(self.tab)
-        self.sldTranslateDelta.setObjectName(u"sldTranslateDelta")
-        self.sldTranslateDelta.setGeometry(QRect(50, 90, 300, 40))
-        self.sldTranslateDelta.setMinimum(-9)
-        self.sldTranslateDelta.setMaximum(9)
-        self.sldTranslateDelta.setPageStep(1)
-        self.sldTranslateDelta.setOrientation(Qt.Horizontal)
-        self.chkWireFrame = QCheckBox(self.tab)
-        self.chkWireFrame.setObjectName(u"chkWireFrame")
-        self.chkWireFrame.setGeometry(QRect(10, 340, 180, 30))
-        self.lbldX = QLabel(self.tab)
-        self.lbldX.setObjectName(u"lbldX")
-        self.lbldX.setGeometry(QRect(10, 10, 40, 20))
-        self.lbldY = QLabel(self.tab)
-        self.lbldY.setObjectName(u"lbldY")
-        self.lbldY.setGeometry(QRect(10, 40, 40, 20))
-        self.lbldZ = QLabel(self.tab)
-        self.lbldZ.setObjectName(u"lbldZ")
-        self.lbldZ.setGeometry(QRect(10, 70, 40, 20))
-        self.lblStep = QLabel(self.tab)
-        self.lblStep.setObjectName(u"lblStep")
-        self.lblStep.setGeometry(QRect(10, 100, 40, 20))
-        self.lblTranslateX = QLabel(self.tab)
-        self.lblTranslateX.setObjectName(u"lblTranslateX")
-        self.lblTranslateX.setGeometry(QRect(360, 10, 100, 20))
-        self.lblTranslateX.setAlignment(Qt.AlignCenter)
-        self.lblTranslateZ = QLabel(self.tab)
-        self.lblTranslateZ.setObjectName(u"lblTranslateZ")
-        self.lblTranslateZ.setGeometry(QRect(360, 70, 100, 20))
-        self.lblTranslateZ.setAlignment(Qt.AlignCenter)
-        self.lblTranslateY = QLabel(self.tab)
-        self.lblTranslateY.setObjectName(u"lblTranslateY")
-        self.lblTranslateY.setGeometry(QRect(360, 40, 100, 20))
-        self.lblTranslateY.setAlignment(Qt.AlignCenter)
-        self.lblTranslateDelta = QLabel(self.tab)
-        self.lblTranslateDelta.setObjectName(u"lblTranslateDelta")
-        self.lblTranslateDelta.setGeometry(QRect(360, 100, 100, 20))
-        self.lblTranslateDelta.setAlignment(Qt.AlignCenter)
-        self.btnAddDimensionZ = QPushButton(self.tab)
-        self.btnAddDimensionZ.setObjectName(u"btnAddDimensionZ")
-        self.btnAddDimensionZ.setEnabled(True)
-        self.btnAddDimensionZ.setGeometry(QRect(310, 260, 140, 40))
-        self.btnAddDimensionZ.setMinimumSize(QSize(0, 0))
-        self.btnAddDimensionZ.setStyleSheet(u"")
-        self.btnOrthographic = QPushButton(self.tab)
-        self.btnOrthographic.setObjectName(u"btnOrthographic")
-        self.btnOrthographic.setEnabled(True)
-        self.btnOrthographic.setGeometry(QRect(10, 160, 140, 40))
-        self.btnOrthographic.setMinimumSize(QSize(0, 0))
-        self.btnOrthographic.setStyleSheet(u"")
-        self.btnPerspective = QPushButton(self.tab)
-        self.btnPerspective.setObjectName(u"btnPerspective")
-        self.btnPerspective.setEnabled(True)
-        self.btnPerspective.setGeometry(QRect(10, 210, 140, 40))
-        self.btnPerspective.setMinimumSize(QSize(0, 0))
-        self.btnPerspective.setStyleSheet(u"")
-        self.btnAddCenterMark = QPushButton(self.tab)
-        self.btnAddCenterMark.setObjectName(u"btnAddCenterMark")
-        self.btnAddCenterMark.setEnabled(True)
-        self.btnAddCenterMark.setGeometry(QRect(160, 160, 140, 40))
-        self.btnAddCenterMark.setMinimumSize(QSize(0, 0))
-        self.btnAddCenterMark.setStyleSheet(u"")
-        self.chkSnap = QCheckBox(self.tab)
-        self.chkSnap.setObjectName(u"chkSnap")
-        self.chkSnap.setGeometry(QRect(10, 370, 180, 30))
-        self.chkSnap.setChecked(True)
-        self.btnDefaultLineColor = QPushButton(self.tab)
-        self.btnDefaultLineColor.setObjectName(u"btnDefaultLineColor")
-        self.btnDefaultLineColor.setEnabled(True)
-        self.btnDefaultLineColor.setGeometry(QRect(310, 210, 140, 40))
-        self.btnDefaultLineColor.setMinimumSize(QSize(0, 0))
-        self.btnDefaultLineColor.setStyleSheet(u"")
-        self.chkCenterMarks = QCheckBox(self.tab)
-        self.chkCenterMarks.setObjectName(u"chkCenterMarks")
-        self.chkCenterMarks.setGeometry(QRect(160, 340, 180, 30))
-        self.chkCenterMarks.setChecked(True)
-        self.chkAutoUpdateView = QCheckBox(self.tab)
-        self.chkAutoUpdateView.setObjectName(u"chkAutoUpdateView")
-        self.chkAutoUpdateView.setGeometry(QRect(10, 400, 180, 30))
-        self.chkAutoRecompute = QCheckBox(self.tab)
-        self.chkAutoRecompute.setObjectName(u"chkAutoRecompute")
-        self.chkAutoRecompute.setGeometry(QRect(160, 370, 180, 30))
-        self.chkAutoRecompute.setChecked(True)
-        self.sldSnapDistance = QSlider(self.tab)
-        self.sldSnapDistance.setObjectName(u"sldSnapDistance")
-        self.sldSnapDistance.setGeometry(QRect(50, 120, 300, 40))
-        self.sldSnapDistance.setMinimum(-9)
-        self.sldSnapDistance.setMaximum(9)
-        self.sldSnapDistance.setPageStep(1)
-        self.sldSnapDistance.setOrientation(Qt.Horizontal)
-        self.lblSnapDistance = QLabel(self.tab)
-        self.lblSnapDistance.setObjectName(u"lblSnapDistance")
-        self.lblSnapDistance.setGeometry(QRect(360, 130, 100, 20))
-        self.lblSnapDistance.setAlignment(Qt.AlignCenter)
-        self.lblSnap = QLabel(self.tab)
-        self.lblSnap.setObjectName(u"lblSnap")
-        self.lblSnap.setGeometry(QRect(10, 130, 40, 20))
-        self.chkBoundingBoxes = QCheckBox(self.tab)
-        self.chkBoundingBoxes.setObjectName(u"chkBoundingBoxes")
-        self.chkBoundingBoxes.setGeometry(QRect(160, 310, 180, 30))
-        self.chkBoundingBoxes.setChecked(True)
-        self.chkAlwaysOnTop = QCheckBox(self.tab)
-        self.chkAlwaysOnTop.setObjectName(u"chkAlwaysOnTop")
-        self.chkAlwaysOnTop.setGeometry(QRect(10, 310, 180, 30))
-        self.btnAddDimensionY = QPushButton(self.tab)
-        self.btnAddDimensionY.setObjectName(u"btnAddDimensionY")
-        self.btnAddDimensionY.setEnabled(True)
-        self.btnAddDimensionY.setGeometry(QRect(160, 260, 140, 40))
-        self.btnAddDimensionY.setMinimumSize(QSize(0, 0))
-        self.btnAddDimensionY.setStyleSheet(u"")
-        self.btnAddDimensionX = QPushButton(self.tab)
-        self.btnAddDimensionX.setObjectName(u"btnAddDimensionX")
-        self.btnAddDimensionX.setEnabled(True)
-        self.btnAddDimensionX.setGeometry(QRect(10, 260, 140, 40))
-        self.btnAddDimensionX.setMinimumSize(QSize(0, 0))
-        self.btnAddDimensionX.setStyleSheet(u"")
-        self.btnToggleOriginMark = QPushButton(self.tab)
-        self.btnToggleOriginMark.setObjectName(u"btnToggleOriginMark")
-        self.btnToggleOriginMark.setEnabled(True)
-        self.btnToggleOriginMark.setGeometry(QRect(160, 210, 140, 40))
-        self.btnToggleOriginMark.setMinimumSize(QSize(0, 0))
-        self.btnToggleOriginMark.setStyleSheet(u"")
+        for spec in self.WIDGETS:
+            self.buildWidget(self.tab, spec)
         self.tabMain.addTab(self.tab, "")
         MainWindow.setCentralWidget(self.centralwidget)
         self.statusBar = QStatusBar(MainWindow)
@@ -963,40 +1106,95 @@ class Ui_MainWindow(object):
 
         self.tabMain.setCurrentIndex(0)
 
-        QMetaObject.connectSlotsByName(MainWindow)
+    def buildWidget(self, parent, spec):
+        widgetClass, name, geometry, properties = spec
+
+        widget = widgetClass(parent)
+        widget.setObjectName(name)
+        widget.setGeometry(geometry)
+
+        # "pageStep" -> setPageStep() etc.
+        for prop, value in properties.items():
+            getattr(widget, f"set{prop[0].upper()}{prop[1:]}")(value)
+
+        setattr(self, name, widget)
 
     def retranslateUi(self, MainWindow):
-        self.actionOpen.setText(QCoreApplication.translate("MainWindow", u"Open", None))
-        self.actionClose.setText(QCoreApplication.translate("MainWindow", u"Close", None))
-        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"About", None))
-        self.btnResetTransforms.setText(QCoreApplication.translate("MainWindow", u"Reset Transforms", None))
-        self.chkWireFrame.setText(QCoreApplication.translate("MainWindow", u"Wireframe mode", None))
-        self.lbldX.setText(QCoreApplication.translate("MainWindow", u"dX", None))
-        self.lbldY.setText(QCoreApplication.translate("MainWindow", u"dY", None))
-        self.lbldZ.setText(QCoreApplication.translate("MainWindow", u"dZ", None))
-        self.lblStep.setText(QCoreApplication.translate("MainWindow", u"Step", None))
-        self.lblTranslateX.setText(QCoreApplication.translate("MainWindow", u"0.0", None))
-        self.lblTranslateZ.setText(QCoreApplication.translate("MainWindow", u"0.0", None))
-        self.lblTranslateY.setText(QCoreApplication.translate("MainWindow", u"0.0", None))
-        self.lblTranslateDelta.setText(QCoreApplication.translate("MainWindow", u"0", None))
-        self.btnAddDimensionZ.setText(QCoreApplication.translate("MainWindow", u"Add Dimension Z", None))
-        self.btnOrthographic.setText(QCoreApplication.translate("MainWindow", u"Orthographic View", None))
-        self.btnPerspective.setText(QCoreApplication.translate("MainWindow", u"Perspective View", None))
-        self.btnAddCenterMark.setText(QCoreApplication.translate("MainWindow", u"Add Center Mark", None))
-        self.chkSnap.setText(QCoreApplication.translate("MainWindow", u"Snap to markers", None))
-        self.btnDefaultLineColor.setText(QCoreApplication.translate("MainWindow", u"Set Line Color", None))
-        self.chkCenterMarks.setText(QCoreApplication.translate("MainWindow", u"Draw center marks", None))
-        self.chkAutoUpdateView.setText(QCoreApplication.translate("MainWindow", u"Auto update view", None))
-        self.chkAutoRecompute.setText(QCoreApplication.translate("MainWindow", u"Auto recompute", None))
-        self.lblSnapDistance.setText(QCoreApplication.translate("MainWindow", u"0", None))
-        self.lblSnap.setText(QCoreApplication.translate("MainWindow", u"Snap", None))
-        self.chkBoundingBoxes.setText(QCoreApplication.translate("MainWindow", u"Draw bounding boxes", None))
-        self.chkAlwaysOnTop.setText(QCoreApplication.translate("MainWindow", u"Always on top", None))
-        self.btnAddDimensionY.setText(QCoreApplication.translate("MainWindow", u"Add Dimension Y", None))
-        self.btnAddDimensionX.setText(QCoreApplication.translate("MainWindow", u"Add Dimension X", None))
-        self.btnToggleOriginMark.setText(QCoreApplication.translate("MainWindow", u"Toggle Origin Mark", None))
-        self.tabMain.setTabText(self.tabMain.indexOf(self.tab),
-                                QCoreApplication.translate("MainWindow", u"Transform", None))
+        tr = self.getTranslations()
+
+        # Repaint once after all the texts are set rather than after each one.
+        MainWindow.setUpdatesEnabled(False)
+
+        try:
+            self.actionOpen.setText(tr[u"Open"])
+            self.actionClose.setText(tr[u"Close"])
+            self.actionAbout.setText(tr[u"About"])
+            self.btnResetTransforms.setText(tr[u"Reset Transforms"])
+            self.chkWireFrame.setText(tr[u"Wireframe mode"])
+            self.lbldX.setText(tr[u"dX"])
+            self.lbldY.setText(tr[u"dY"])
+            self.lbldZ.setText(tr[u"dZ"])
+            self.lblStep.setText(tr[u"Step"])
+            self.lblTranslateX.setText(tr[u"0.0"])
+            self.lblTranslateZ.setText(tr[u"0.0"])
+            self.lblTranslateY.setText(tr[u"0.0"])
+            self.lblTranslateDelta.setText(tr[u"0"])
+            self.btnAddDimensionZ.setText(tr[u"Add Dimension Z"])
+            self.btnOrthographic.setText(tr[u"Orthographic View"])
+            self.btnPerspective.setText(tr[u"Perspective View"])
+            self.btnAddCenterMark.setText(tr[u"Add Center Mark"])
+            self.chkSnap.setText(tr[u"Snap to markers"])
+            self.btnDefaultLineColor.setText(tr[u"Set Line Color"])
+            self.chkCenterMarks.setText(tr[u"Draw center marks"])
+            self.chkAutoUpdateView.setText(tr[u"Auto update view"])
+            self.chkAutoRecompute.setText(tr[u"Auto recompute"])
+            self.lblSnapDistance.setText(tr[u"0"])
+            self.lblSnap.setText(tr[u"Snap"])
+            self.chkBoundingBoxes.setText(tr[u"Draw bounding boxes"])
+            self.chkAlwaysOnTop.setText(tr[u"Always on top"])
+            self.btnAddDimensionY.setText(tr[u"Add Dimension Y"])
+            self.btnAddDimensionX.setText(tr[u"Add Dimension X"])
+            self.btnToggleOriginMark.setText(tr[u"Toggle Origin Mark"])
+            self.tabMain.setTabText(self.tabMain.indexOf(self.tab), tr[u"Transform"])
+        finally:
+            MainWindow.setUpdatesEnabled(True)
+
+    @classmethod
+    def getTranslations(cls):
+        # The translated texts are looked up once and shared by all instances; a language change
+        # resets them (see MacroWindow.changeEvent).
+        if cls.translations is None:
+            cls.translations = {
+                u"Open": QCoreApplication.translate("MainWindow", u"Open", None),
+                u"Close": QCoreApplication.translate("MainWindow", u"Close", None),
+                u"About": QCoreApplication.translate("MainWindow", u"About", None),
+                u"Reset Transforms": QCoreApplication.translate("MainWindow", u"Reset Transforms", None),
+                u"Wireframe mode": QCoreApplication.translate("MainWindow", u"Wireframe mode", None),
+                u"dX": QCoreApplication.translate("MainWindow", u"dX", None),
+                u"dY": QCoreApplication.translate("MainWindow", u"dY", None),
+                u"dZ": QCoreApplication.translate("MainWindow", u"dZ", None),
+                u"Step": QCoreApplication.translate("MainWindow", u"Step", None),
+                u"0.0": QCoreApplication.translate("MainWindow", u"0.0", None),
+                u"0": QCoreApplication.translate("MainWindow", u"0", None),
+                u"Add Dimension Z": QCoreApplication.translate("MainWindow", u"Add Dimension Z", None),
+                u"Orthographic View": QCoreApplication.translate("MainWindow", u"Orthographic View", None),
+                u"Perspective View": QCoreApplication.translate("MainWindow", u"Perspective View", None),
+                u"Add Center Mark": QCoreApplication.translate("MainWindow", u"Add Center Mark", None),
+                u"Snap to markers": QCoreApplication.translate("MainWindow", u"Snap to markers", None),
+                u"Set Line Color": QCoreApplication.translate("MainWindow", u"Set Line Color", None),
+                u"Draw center marks": QCoreApplication.translate("MainWindow", u"Draw center marks", None),
+                u"Auto update view": QCoreApplication.translate("MainWindow", u"Auto update view", None),
+                u"Auto recompute": QCoreApplication.translate("MainWindow", u"Auto recompute", None),
+                u"Snap": QCoreApplication.translate("MainWindow", u"Snap", None),
+                u"Draw bounding boxes": QCoreApplication.translate("MainWindow", u"Draw bounding boxes", None),
+                u"Always on top": QCoreApplication.translate("MainWindow", u"Always on top", None),
+                u"Add Dimension Y": QCoreApplication.translate("MainWindow", u"Add Dimension Y", None),
+                u"Add Dimension X": QCoreApplication.translate("MainWindow", u"Add Dimension X", None),
+                u"Toggle Origin Mark": QCoreApplication.translate("MainWindow", u"Toggle Origin Mark", None),
+                u"Transform": QCoreApplication.translate("MainWindow", u"Transform", None)
+            }
+
+        return cls.translations
 # ===========================================================================
 macroWindow = MacroWindow()
 # ===========================================================================